@@ -14,6 +14,7 @@ MY MCP Server
         - 응답: category를 한글 키로 정규화 + 그룹핑(기온/습도/강수/바람)
         - PTY(강수형태) 코드값을 한글 설명으로 변환
         - VEC(풍향) 값을 16방위 한글로 변환
+        - 같은 지역/발표시각의 정상 응답은 3시간 동안 캐시
 
 환경 변수:
         - KMA_SERVICE_KEY: 공공데이터포털 인증키(ServiceKey)
@@ -29,12 +30,19 @@ MY MCP Server
 
 from __future__ import annotations
 
+import asyncio
 import os
+import re
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import anyio
 import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 
@@ -49,6 +57,22 @@ ULTRA_SRT_NCST_URL = (
     "https://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst"
 )
 
+# 인증키 호출 한도 보호
+# - KMA_MAX_CONCURRENCY: 서버 전체에서 동시에 진행하는 기상청 요청 수 상한(모든 도구 공통)
+# - BATCH_MAX_CITIES: get_now_weather_batch 한 번에 받을 수 있는 입력 도시 수 상한
+KMA_MAX_CONCURRENCY = 8
+BATCH_MAX_CITIES = 20
+
+# 한 페이지 요청 건수: 초단기실황은 지점당 카테고리 8개 안팎이라 작게 요청
+NUM_OF_ROWS = 20
+
+# 호출마다 바뀌지 않는 요청 파라미터
+_STATIC_PARAMS: Dict[str, str] = {
+    "numOfRows": str(NUM_OF_ROWS),
+    "pageNo": "1",
+    "dataType": "JSON",
+}
+
 # 광역(특별)시 대표 격자 좌표(nx, ny)
 # - 광역 단위 데모/과제 목적의 "대표 지점"입니다. (도시 내부 지역별 오차는 감수)
 CITY_TO_GRID: Dict[str, Tuple[int, int]] = {
@@ -62,29 +86,62 @@ CITY_TO_GRID: Dict[str, Tuple[int, int]] = {
     "세종": (66, 103),
 }
 
-# PTY(강수형태) 코드(초단기 기준)
-PTY_MAP_ULTRA: Dict[int, str] = {
-    0: "없음",
-    1: "비",
-    2: "비/눈",
-    3: "눈",
-    4: "소나기",  # 문서/데이터에 따라 포함될 수 있어 확장
-    5: "빗방울",
-    6: "빗방울/눈날림",
-    7: "눈날림",
+# 지원 도시 목록(정렬 결과를 import 시 한 번만 계산)
+_SUPPORTED_CITIES_SORTED: Tuple[str, ...] = tuple(sorted(CITY_TO_GRID.keys()))
+
+# 자주 들어오는 도시 표기 -> 정규화 결과(정규식 없이 바로 반환하는 fast path)
+_CITY_ALIASES: Dict[str, str] = {
+    **{name: name for name in CITY_TO_GRID},
+    **{f"{name}시": name for name in CITY_TO_GRID},
+    "서울특별시": "서울",
+    "부산광역시": "부산",
+    "대구광역시": "대구",
+    "인천광역시": "인천",
+    "광주광역시": "광주",
+    "대전광역시": "대전",
+    "울산광역시": "울산",
+    "세종특별자치시": "세종",
 }
 
-# 초단기실황 카테고리: 한글명/단위/그룹/형변환
-CATEGORY_META: Dict[str, Dict[str, Any]] = {
-    "T1H": {"ko": "기온", "unit": "℃", "group": "기온", "cast": float},
-    "REH": {"ko": "습도", "unit": "%", "group": "습도", "cast": int},
-    "RN1": {"ko": "1시간 강수량", "unit": "mm", "group": "강수", "cast": float},
-    "PTY": {"ko": "강수형태", "unit": "코드", "group": "강수", "cast": int},
-    "VEC": {"ko": "풍향", "unit": "deg", "group": "바람", "cast": int},
-    "WSD": {"ko": "풍속", "unit": "m/s", "group": "바람", "cast": float},
-    "UUU": {"ko": "동서바람성분", "unit": "m/s", "group": "바람", "cast": float},
-    "VVV": {"ko": "남북바람성분", "unit": "m/s", "group": "바람", "cast": float},
-}
+# 행정구역 접미사 제거(바깥쪽부터 특별자치시 -> 특별시 -> 광역시 -> 시 순서로 한 번씩)
+_CITY_SUFFIX_RE = re.compile(r"(?:시)?(?:광역시)?(?:특별시)?(?:특별자치시)?$")
+
+# PTY(강수형태) 코드(초단기 기준)
+PTY_MAP_ULTRA: Mapping[int, str] = MappingProxyType(
+    {
+        0: "없음",
+        1: "비",
+        2: "비/눈",
+        3: "눈",
+        4: "소나기",  # 문서/데이터에 따라 포함될 수 있어 확장
+        5: "빗방울",
+        6: "빗방울/눈날림",
+        7: "눈날림",
+    }
+)
+
+
+def _to_int(s: str) -> int:
+    """'3.0' 같은 실수 표기도 허용하는 정수 변환기"""
+    return int(float(s))
+
+
+# 초단기실황 카테고리: (한글명, 단위, 그룹, 형변환 함수)
+# - 항목당 한 번의 조회 + 튜플 언패킹으로 꺼내도록 평평한 튜플로 둡니다.
+CATEGORY_META: Mapping[str, Tuple[str, str, str, Callable[[str], Any]]] = (
+    MappingProxyType(
+        {
+            "T1H": ("기온", "℃", "기온", float),
+            "REH": ("습도", "%", "습도", _to_int),
+            "RN1": ("1시간 강수량", "mm", "강수", float),
+            "PTY": ("강수형태", "코드", "강수", _to_int),
+            "VEC": ("풍향", "deg", "바람", _to_int),
+            "WSD": ("풍속", "m/s", "바람", float),
+            "UUU": ("동서바람성분", "m/s", "바람", float),
+            "VVV": ("남북바람성분", "m/s", "바람", float),
+        }
+    )
+)
 
 # 풍향(deg) -> 16방위 한글
 WIND_DIR_16_KO = [
@@ -106,6 +163,12 @@ WIND_DIR_16_KO = [
     "북북서",
 ]
 
+# 풍향(정수 deg 0~359) -> 16방위 한글 사전 계산 테이블
+# - 16방위: 22.5도 간격, 중앙값 보정(+11.25)
+_DEG_TO_DIR: Tuple[str, ...] = tuple(
+    WIND_DIR_16_KO[int((d + 11.25) // 22.5) % 16] for d in range(360)
+)
+
 # =============================================================================
 # FastMCP 서버 생성
 # =============================================================================
@@ -121,6 +184,87 @@ mcp = FastMCP(
     ),
 )
 
+# =============================================================================
+# HTTP 클라이언트(커넥션 풀)
+# =============================================================================
+
+# 도구 호출마다 TCP/TLS 핸드셰이크를 반복하지 않도록 프로세스 단위로 재사용합니다.
+# - 서버 이벤트 루프 안에서 만들어지며, 서버 종료 시 main()이 같은 루프에서 닫습니다.
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """공유 httpx.AsyncClient를 지연 생성해 반환합니다(keep-alive + HTTP/2)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=8.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={"Accept": "application/json"},
+        )
+    return _HTTP_CLIENT
+
+
+# 기상청 요청 동시 실행 제한(서버 전체 공유, 클라이언트와 같이 이벤트 루프 안에서 지연 생성)
+_KMA_LIMITER: Optional[asyncio.Semaphore] = None
+
+
+def _get_limiter() -> asyncio.Semaphore:
+    """모든 fetch_ultra_srt_ncst 호출이 공유하는 세마포어를 반환합니다."""
+    global _KMA_LIMITER
+    if _KMA_LIMITER is None:
+        _KMA_LIMITER = asyncio.Semaphore(KMA_MAX_CONCURRENCY)
+    return _KMA_LIMITER
+
+
+async def _close_client() -> None:
+    """공유 httpx.AsyncClient가 있으면 닫습니다(서버 종료 시 호출)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+# =============================================================================
+# 초단기실황 응답 캐시
+# =============================================================================
+
+# 한 번 발표된 정시 자료는 바뀌지 않으므로, 정상 + 데이터 존재 응답만 TTL 동안 재사용합니다.
+# - 키: (nx, ny, base_date, base_time)
+# - 값: (저장 시각(monotonic), (resultCode, resultMsg, items))
+# - 한 base_time은 최근 정각(약 1시간) + -1시간 후보(약 1시간) 동안만 요청되므로,
+#   TTL을 그보다 길게 잡아 재검증 없이 수명 내내 캐시로 응답합니다.
+NOWCAST_CACHE_TTL_SEC = 3 * 3600.0
+_NOWCAST_CACHE: Dict[
+    Tuple[int, int, str, str], Tuple[float, Tuple[str, str, List[Dict[str, Any]]]]
+] = {}
+
+
+def _nowcast_cache_fresh(
+    key: Tuple[int, int, str, str],
+) -> Optional[Tuple[str, str, List[Dict[str, Any]]]]:
+    """TTL 이내의 캐시 응답만 반환합니다(없거나 만료되면 None)."""
+    hit = _NOWCAST_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < NOWCAST_CACHE_TTL_SEC:
+        return hit[1]
+    return None
+
+
+def _nowcast_cache_put(
+    key: Tuple[int, int, str, str],
+    result: Tuple[str, str, List[Dict[str, Any]]],
+) -> None:
+    """응답을 저장하면서 만료된 항목을 함께 정리합니다."""
+    now = time.monotonic()
+    expired = [
+        k for k, (ts, _) in _NOWCAST_CACHE.items() if now - ts >= NOWCAST_CACHE_TTL_SEC
+    ]
+    for k in expired:
+        del _NOWCAST_CACHE[k]
+    _NOWCAST_CACHE[key] = (now, result)
+
+
 # =============================================================================
 # 내부 유틸
 # =============================================================================
@@ -134,6 +278,18 @@ def _need_env(name: str) -> str:
     return v
 
 
+# KMA 인증키: import 시 한 번 읽어 두고, 비어 있으면 호출 시점에 다시 읽음(런타임 주입 대응)
+_SERVICE_KEY: Optional[str] = (os.getenv("KMA_SERVICE_KEY") or "").strip() or None
+
+
+def _service_key() -> str:
+    """캐시된 KMA 인증키를 반환합니다(없으면 환경 변수를 다시 읽고, 그래도 비면 예외)."""
+    global _SERVICE_KEY
+    if _SERVICE_KEY is None:
+        _SERVICE_KEY = _need_env("KMA_SERVICE_KEY")
+    return _SERVICE_KEY
+
+
 def normalize_city(city: str) -> str:
     """
     도시 입력을 관용적으로 정규화합니다.
@@ -142,10 +298,10 @@ def normalize_city(city: str) -> str:
     if not city:
         return ""
     s = city.strip()
-    for suffix in ("특별자치시", "특별시", "광역시", "시"):
-        if s.endswith(suffix):
-            s = s[: -len(suffix)]
-    return s.strip()
+    alias = _CITY_ALIASES.get(s)
+    if alias is not None:
+        return alias
+    return _CITY_SUFFIX_RE.sub("", s, count=1).strip()
 
 
 def now_kst() -> datetime:
@@ -153,7 +309,8 @@ def now_kst() -> datetime:
 
 
 def as_base_date(d: datetime) -> str:
-    return d.strftime("%Y%m%d")
+    # "YYYYMMDD" (strftime 포맷 해석 없이 바로 조립)
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
 
 
 def as_base_time_hour(d: datetime) -> str:
@@ -161,7 +318,7 @@ def as_base_time_hour(d: datetime) -> str:
     return f"{d.hour:02d}00"
 
 
-def safe_cast(meta_cast: Any, raw: Any) -> Any:
+def safe_cast(cast_fn: Callable[[str], Any], raw: Any) -> Any:
     """
     obsrValue(문자열)를 적절한 숫자형으로 변환합니다.
     - 실패하면 원본(raw)을 유지합니다.
@@ -173,21 +330,27 @@ def safe_cast(meta_cast: Any, raw: Any) -> Any:
         return None
 
     try:
-        if meta_cast is int:
-            return int(float(s))
-        if meta_cast is float:
-            return float(s)
-        return meta_cast(s)
+        return cast_fn(s)
     except Exception:
         return raw
 
 
-def wind_deg_to_16dir_ko(deg: Optional[int]) -> Optional[str]:
+def wind_deg_to_16dir_ko(deg: Optional[float]) -> Optional[str]:
     if deg is None:
         return None
-    # 16방위: 22.5도 간격, 중앙값 보정(+11.25)
-    idx = int(((deg % 360) + 11.25) // 22.5) % 16
-    return WIND_DIR_16_KO[idx]
+    if isinstance(deg, int):
+        return _DEG_TO_DIR[deg % 360]
+    # 실수 deg는 테이블 대신 원래 공식(22.5도 간격, 중앙값 보정 +11.25)으로 계산
+    return WIND_DIR_16_KO[int(((deg % 360) + 11.25) // 22.5) % 16]
+
+
+def extract_header(api_json: Dict[str, Any]) -> Tuple[str, str]:
+    """응답 header에서 (resultCode, resultMsg)를 꺼냅니다."""
+    header = api_json.get("response", {}).get("header", {})
+    return (
+        str(header.get("resultCode", "")).strip(),
+        str(header.get("resultMsg", "")).strip(),
+    )
 
 
 def extract_items(api_json: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -204,6 +367,14 @@ def extract_items(api_json: Dict[str, Any]) -> List[Dict[str, Any]]:
         return []
 
 
+def extract_total_count(api_json: Dict[str, Any]) -> Optional[int]:
+    """응답 body.totalCount를 정수로 꺼냅니다(없거나 형식이 다르면 None)."""
+    try:
+        return int(api_json.get("response", {}).get("body", {}).get("totalCount"))
+    except Exception:
+        return None
+
+
 def normalize_observations(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     카테고리 한글 변환 + 사람이 보기 좋은 그룹 키(기온/습도/강수/바람)로 묶습니다.
@@ -216,119 +387,174 @@ def normalize_observations(items: List[Dict[str, Any]]) -> Dict[str, Any]:
         "기타": {},
     }
 
+    # 루프 안에서 반복되는 전역/속성 조회를 지역 변수로 고정
+    meta_get = CATEGORY_META.get
+    pty_get = PTY_MAP_ULTRA.get
+    deg_to_dir = _DEG_TO_DIR
+    group_get = grouped.get
+    etc = grouped["기타"]
+
     for it in items:
         code = str(it.get("category", "")).strip()
         raw_val = it.get("obsrValue")
 
-        meta = CATEGORY_META.get(code)
+        meta = meta_get(code)
         if meta:
-            name_ko = meta["ko"]
-            unit = meta["unit"]
-            group = meta["group"]
-            val = safe_cast(meta.get("cast"), raw_val)
+            name_ko, unit, group, cast = meta
+            val = safe_cast(cast, raw_val)
+            entry: Dict[str, Any] = {"코드": code, "값": val, "단위": unit}
+            bucket = group_get(group, etc)
         else:
             name_ko = code or "UNKNOWN"
-            unit = None
-            group = "기타"
             val = raw_val
-
-        entry: Dict[str, Any] = {
-            "코드": code,
-            "값": val,
-            "단위": unit,
-        }
+            entry = {"코드": code, "값": val, "단위": None}
+            bucket = etc
 
         # PTY(강수형태) 코드 → 한글 설명
+        # - PTY/VEC는 cast가 이미 정수 변환을 시도했으므로, int가 아니면 변환 실패로 간주
         if code == "PTY":
-            pty_int = val if isinstance(val, int) else safe_cast(int, raw_val)
-            if isinstance(pty_int, int):
-                entry["설명"] = PTY_MAP_ULTRA.get(pty_int, f"알 수 없음({pty_int})")
+            if isinstance(val, int):
+                entry["설명"] = pty_get(val, f"알 수 없음({val})")
             else:
                 entry["설명"] = "알 수 없음"
 
         # VEC(풍향) → 16방위 한글
-        if code == "VEC":
-            vec_int = val if isinstance(val, int) else safe_cast(int, raw_val)
-            if isinstance(vec_int, int):
-                entry["16방위"] = wind_deg_to_16dir_ko(vec_int)
-
-        if group not in grouped:
-            group = "기타"
+        elif code == "VEC":
+            if isinstance(val, int):
+                entry["16방위"] = deg_to_dir[val % 360]
 
         # 사람이 보기 좋은 키: 한글 항목명
-        key = name_ko
-        if key in grouped[group]:
-            key = f"{key}({code})"
+        if name_ko in bucket:
+            name_ko = f"{name_ko}({code})"
 
-        grouped[group][key] = entry
+        bucket[name_ko] = entry
 
     return grouped
 
 
-def fetch_ultra_srt_ncst(
-    client: httpx.Client,
+async def fetch_ultra_srt_ncst(
+    client: httpx.AsyncClient,
     service_key: str,
     base_date: str,
     base_time: str,
     nx: int,
     ny: int,
-) -> Dict[str, Any]:
+) -> Tuple[str, str, List[Dict[str, Any]]]:
     """
-    httpx(httpx)로 기상청 초단기실황(getUltraSrtNcst)을 호출해 JSON(dict)을 반환합니다.
+    httpx(httpx)로 기상청 초단기실황(getUltraSrtNcst)을 호출합니다.
+
+    Returns:
+            (resultCode, resultMsg, items)
+            - 사용하는 필드만 남기고 나머지 응답 트리(body/pagination 등)는 바로 버립니다.
     """
     params = {
+        **_STATIC_PARAMS,
         "serviceKey": service_key,
-        "numOfRows": "1000",
-        "pageNo": "1",
-        "dataType": "JSON",
         "base_date": base_date,
         "base_time": base_time,
         "nx": str(nx),
         "ny": str(ny),
     }
 
-    r = client.get(
-        ULTRA_SRT_NCST_URL, params=params, headers={"Accept": "application/json"}
-    )
+    r = await client.get(ULTRA_SRT_NCST_URL, params=params)
     r.raise_for_status()
-    return r.json()
 
+    # r.json()(표준 json) 대신 orjson으로 바이트를 바로 파싱
+    api_json = orjson.loads(r.content)
+    result_code, result_msg = extract_header(api_json)
+    items = extract_items(api_json)
 
-# =============================================================================
-# Tools (도구)
-# =============================================================================
+    # 방어 코드: totalCount가 한 페이지(NUM_OF_ROWS)를 넘으면 2페이지까지만 한 번 더 조회
+    # - 초단기실황은 이 경우가 사실상 없으므로, 잘못된 totalCount로 요청이 늘어나지 않게 상한을 둠
+    total_count = extract_total_count(api_json) or 0
+    if result_code == "00" and len(items) < total_count:
+        r = await client.get(ULTRA_SRT_NCST_URL, params={**params, "pageNo": "2"})
+        r.raise_for_status()
+        items = items + extract_items(orjson.loads(r.content))
 
+    return result_code, result_msg, items
 
-@mcp.tool()
-def list_supported_cities() -> Dict[str, Any]:
-    """
-    지원하는 광역(특별)시 목록을 반환합니다.
-    """
+
+def _make_attempt(
+    base_date: str,
+    base_time: str,
+    result: Tuple[str, str, List[Dict[str, Any]]],
+    cached: bool,
+) -> Dict[str, Any]:
+    """조회 1회의 attempts 기록을 만듭니다."""
+    result_code, result_msg, items = result
     return {
-        "supported_cities": sorted(CITY_TO_GRID.keys()),
-        "examples": ["서울", "서울특별시", "서울시", "부산", "부산광역시", "세종시"],
+        "base_date": base_date,
+        "base_time": base_time,
+        "resultCode": result_code,
+        "resultMsg": result_msg,
+        "count": len(items),
+        "cached": cached,
     }
 
 
-@mcp.tool()
-def get_now_weather(city: str) -> Dict[str, Any]:
+async def _try_candidate(
+    client: httpx.AsyncClient,
+    service_key: str,
+    base_date: str,
+    base_time: str,
+    nx: int,
+    ny: int,
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], Optional[str]]:
     """
-    광역시명을 입력받아, 오늘 날짜 기준 가장 최근 정각(데이터 없으면 -1시간)의 초단기실황을 조회합니다.
-
-    규칙:
-    - base_date: 당일(KST) 고정
-    - base_time: 최근 정각(HH00)
-    - items가 비어있으면: -1시간 재조회(단, 날짜가 바뀌면 재조회하지 않음)
+    base_time 후보 하나를 조회합니다.
+    - 실제 기상청 요청은 서버 전체 공유 세마포어(KMA_MAX_CONCURRENCY) 안에서만 진행
 
     Returns:
-            성공: ok=true + 그룹핑된 실황(JSON)
-            실패: ok=false + 에러 메시지
+            (attempt 기록 또는 None, items, 에러 메시지 또는 None)
+            - 에러 메시지가 None이면 resultCode=00 + items 존재(성공)
     """
+    cache_key = (nx, ny, base_date, base_time)
     try:
-        service_key = _need_env("KMA_SERVICE_KEY")
+        result = _nowcast_cache_fresh(cache_key)
+        cached = result is not None
+        if result is None:
+            async with _get_limiter():
+                result = await fetch_ultra_srt_ncst(
+                    client=client,
+                    service_key=service_key,
+                    base_date=base_date,
+                    base_time=base_time,
+                    nx=nx,
+                    ny=ny,
+                )
+
+        result_code, result_msg, items = result
+        attempt = _make_attempt(base_date, base_time, result, cached)
+
+        # API 자체가 정상(00) + items 존재하면 성공 처리
+        if result_code == "00" and items:
+            if not cached:
+                _nowcast_cache_put(cache_key, result)
+            return attempt, items, None
+
+        return (
+            attempt,
+            [],
+            f"정상 응답이지만 데이터가 비어있습니다(resultCode={result_code}, count={len(items)})",
+        )
+
+    except httpx.HTTPStatusError as e:
+        return None, [], f"HTTPStatusError: {e}"
+    except httpx.RequestError as e:
+        return None, [], f"RequestError: {e}"
     except Exception as e:
-        return {"ok": False, "error": str(e)}
+        return None, [], f"Exception: {e}"
+
 
+async def _fetch_now_weather(
+    client: httpx.AsyncClient,
+    service_key: str,
+    city: str,
+) -> Dict[str, Any]:
+    """
+    도시 하나의 초단기실황을 조회합니다(get_now_weather / get_now_weather_batch 공용).
+    """
     city_norm = normalize_city(city)
     if city_norm not in CITY_TO_GRID:
         return {
@@ -336,7 +562,7 @@ def get_now_weather(city: str) -> Dict[str, Any]:
             "error": "지원하지 않는 지역입니다.",
             "input": city,
             "normalized": city_norm,
-            "supported_cities": sorted(CITY_TO_GRID.keys()),
+            "supported_cities": list(_SUPPORTED_CITIES_SORTED),
         }
 
     nx, ny = CITY_TO_GRID[city_norm]
@@ -346,22 +572,27 @@ def get_now_weather(city: str) -> Dict[str, Any]:
     base_date = as_base_date(now)
 
     # 1차: 최근 정각, 2차: -1시간(동일 날짜만)
+    # - 날짜가 바뀌면(base_date 고정 요구사항) 재시도하지 않음: 00시에는 -1시간 후보가 없음
     hour_floor = now.replace(minute=0, second=0, microsecond=0)
-    candidates: List[datetime] = [hour_floor, hour_floor - timedelta(hours=1)]
+    candidate_times: List[str] = [as_base_time_hour(hour_floor)]
+    if hour_floor.hour > 0:
+        candidate_times.append(as_base_time_hour(hour_floor - timedelta(hours=1)))
 
     attempts: List[Dict[str, Any]] = []
     last_error: Optional[str] = None
 
-    with httpx.Client(timeout=8.0) as client:
-        for cand_dt in candidates:
-            # 날짜가 바뀌면(base_date 고정 요구사항) 재시도하지 않음
-            if as_base_date(cand_dt) != base_date:
-                continue
-
-            base_time = as_base_time_hour(cand_dt)
+    found: Optional[List[Dict[str, Any]]] = None
 
-            try:
-                api_json = fetch_ultra_srt_ncst(
+    # 최근 정각 자료가 캐시에 있으면 네트워크 없이 바로 반환(-1시간 후보도 조회하지 않음)
+    fresh = _nowcast_cache_fresh((nx, ny, base_date, candidate_times[0]))
+    if fresh is not None:
+        attempts.append(_make_attempt(base_date, candidate_times[0], fresh, True))
+        found = fresh[2]
+    else:
+        # 후보 시각을 동시에 조회하되, 채택은 최근 정각 우선(순서대로 await)
+        tasks = [
+            asyncio.create_task(
+                _try_candidate(
                     client=client,
                     service_key=service_key,
                     base_date=base_date,
@@ -369,42 +600,36 @@ def get_now_weather(city: str) -> Dict[str, Any]:
                     nx=nx,
                     ny=ny,
                 )
-
-                header = api_json.get("response", {}).get("header", {})
-                result_code = str(header.get("resultCode", "")).strip()
-                result_msg = str(header.get("resultMsg", "")).strip()
-
-                items = extract_items(api_json)
-                attempts.append(
-                    {
-                        "base_date": base_date,
-                        "base_time": base_time,
-                        "resultCode": result_code,
-                        "resultMsg": result_msg,
-                        "count": len(items),
-                    }
-                )
-
-                # API 자체가 정상(00) + items 존재하면 성공 처리
-                if result_code == "00" and items:
-                    # baseDate/baseTime/nx/ny는 item에도 있으나, 우리가 쓰는 값으로 고정해 반환
-                    return {
-                        "ok": True,
-                        "지역": city_norm,
-                        "격자": {"nx": nx, "ny": ny},
-                        "발표": {"base_date": base_date, "base_time": base_time},
-                        "실황": normalize_observations(items),
-                        "attempts": attempts,
-                    }
-
-                last_error = f"정상 응답이지만 데이터가 비어있습니다(resultCode={result_code}, count={len(items)})"
-
-            except httpx.HTTPStatusError as e:
-                last_error = f"HTTPStatusError: {e}"
-            except httpx.RequestError as e:
-                last_error = f"RequestError: {e}"
-            except Exception as e:
-                last_error = f"Exception: {e}"
+            )
+            for base_time in candidate_times
+        ]
+
+        try:
+            for task in tasks:
+                attempt, items, error = await task
+                if attempt is not None:
+                    attempts.append(attempt)
+
+                if error is None:
+                    found = items
+                    break
+
+                last_error = error
+        finally:
+            # 앞선 후보가 성공했다면 남은 조회는 필요 없음
+            for task in tasks:
+                task.cancel()
+
+    if found is not None:
+        # baseDate/baseTime/nx/ny는 item에도 있으나, 우리가 쓰는 값으로 고정해 반환
+        return {
+            "ok": True,
+            "지역": city_norm,
+            "격자": {"nx": nx, "ny": ny},
+            "발표": {"base_date": base_date, "base_time": attempts[-1]["base_time"]},
+            "실황": normalize_observations(found),
+            "attempts": attempts,
+        }
 
     return {
         "ok": False,
@@ -413,14 +638,106 @@ def get_now_weather(city: str) -> Dict[str, Any]:
         "격자": {"nx": nx, "ny": ny},
         "발표": {
             "base_date": base_date,
-            "candidate_times": [
-                as_base_time_hour(c) for c in candidates if as_base_date(c) == base_date
-            ],
+            "candidate_times": candidate_times,
         },
         "attempts": attempts,
     }
 
 
+# =============================================================================
+# Tools (도구)
+# =============================================================================
+
+
+@mcp.tool()
+def list_supported_cities() -> Dict[str, Any]:
+    """
+    지원하는 광역(특별)시 목록을 반환합니다.
+    """
+    return {
+        "supported_cities": list(_SUPPORTED_CITIES_SORTED),
+        "examples": ["서울", "서울특별시", "서울시", "부산", "부산광역시", "세종시"],
+    }
+
+
+@mcp.tool()
+async def get_now_weather(city: str) -> Dict[str, Any]:
+    """
+    광역시명을 입력받아, 오늘 날짜 기준 가장 최근 정각(데이터 없으면 -1시간)의 초단기실황을 조회합니다.
+
+    규칙:
+    - base_date: 당일(KST) 고정
+    - base_time: 최근 정각(HH00)
+    - items가 비어있으면: -1시간 재조회(단, 날짜가 바뀌면 재조회하지 않음)
+      (두 후보는 동시에 요청하고, 최근 정각 결과를 우선 채택)
+
+    Returns:
+            성공: ok=true + 그룹핑된 실황(JSON)
+            실패: ok=false + 에러 메시지
+    """
+    try:
+        service_key = _service_key()
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+    return await _fetch_now_weather(_get_client(), service_key, city)
+
+
+@mcp.tool()
+async def get_now_weather_batch(cities: List[str]) -> Dict[str, Any]:
+    """
+    여러 광역시의 초단기실황을 한 번에(동시에) 조회합니다.
+
+    규칙:
+    - 도시별 조회 규칙은 get_now_weather와 동일
+    - 입력은 최대 20개
+    - 기상청 요청은 서버 전체(다른 도구 호출 포함)에서 동시에 최대 8개(인증키 호출 한도 보호)
+    - 같은 지역으로 정규화되는 입력(예: 부산/부산광역시/부산시)은 한 번만 조회해 결과를 공유
+
+    Returns:
+            ok=true + results(입력 도시명 -> get_now_weather와 같은 형태의 결과)
+            실패(인증키 없음/입력 초과): ok=false + 에러 메시지
+    """
+    try:
+        service_key = _service_key()
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+    if len(cities) > BATCH_MAX_CITIES:
+        return {
+            "ok": False,
+            "error": f"한 번에 최대 {BATCH_MAX_CITIES}개 도시까지 조회할 수 있습니다.",
+            "count": len(cities),
+        }
+
+    # 같은 지역으로 정규화되는 입력은 한 묶음으로 모아 한 번만 조회
+    # - 지원하지 않는 입력은 네트워크를 쓰지 않으므로 입력별로 그대로 처리
+    groups: Dict[str, List[str]] = {}
+    for city in dict.fromkeys(cities):
+        city_norm = normalize_city(city)
+        group_key = city_norm if city_norm in CITY_TO_GRID else city
+        groups.setdefault(group_key, []).append(city)
+
+    client = _get_client()
+    members_list = list(groups.values())
+    results = await asyncio.gather(
+        *(
+            _fetch_now_weather(client, service_key, members[0])
+            for members in members_list
+        ),
+        return_exceptions=True,
+    )
+
+    merged: Dict[str, Any] = {}
+    for members, result in zip(members_list, results):
+        if isinstance(result, Exception):
+            result = {"ok": False, "error": f"Exception: {result}"}
+        for city in members:
+            merged[city] = result
+
+    return {"ok": True, "results": merged}
+
+
 # =============================================================================
 # Resources (리소스)
 # =============================================================================
@@ -449,6 +766,13 @@ def get_readme() -> str:
 - 출력:
   - 실황: 기온/습도/강수/바람 그룹으로 보기 좋게 묶은 JSON
   - PTY(강수형태) 및 VEC(풍향)는 한글 설명(text) 포함
+- 캐시: 같은 지역/발표시각의 정상 응답은 3시간 동안 재사용(attempts[].cached)
+
+### get_now_weather_batch
+- 입력: cities (예: ["서울", "부산광역시", "세종시"])
+- 도시별 결과를 동시에 조회해 results(입력 도시명 -> get_now_weather 결과)로 반환
+- 같은 지역으로 정규화되는 입력은 한 번만 조회해 결과를 공유
+- 입력은 최대 20개, 기상청 요청은 서버 전체에서 동시에 최대 8개(모든 도구 공통)
 """
 
 
@@ -478,6 +802,20 @@ MCP tool `get_now_weather` 결과(JSON)를 읽고, '{city}'의 현재 날씨를
 # =============================================================================
 
 
+async def _serve(transport: str) -> None:
+    """
+    MCP 서버를 실행하고, 종료 시 같은 이벤트 루프에서 공유 HTTP 클라이언트를 닫습니다.
+    (mcp.run()과 동일하게 anyio.run 위에서 *_async 실행기를 호출)
+    """
+    try:
+        if transport == "streamable-http":
+            await mcp.run_streamable_http_async()
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        await _close_client()
+
+
 def main():
     """
     MCP 서버 메인 진입점입니다.
@@ -489,14 +827,18 @@ def main():
     환경 변수:
     - PORT: HTTP 서버 포트(기본값: 8080)
     """
-    import sys
+    # 동시 도구 호출 처리량을 위해 asyncio 이벤트 루프를 uvloop로 교체(Windows 미지원)
+    if sys.platform != "win32":
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     if "--http-stream" in sys.argv:
         port = int(os.environ.get("PORT", 8080))
         mcp.settings.port = port
-        mcp.run(transport="streamable-http")
+        anyio.run(_serve, "streamable-http")
     else:
-        mcp.run(transport="stdio")
+        anyio.run(_serve, "stdio")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+"""
+src/server.py 동작 검증(네트워크 없이 가짜 AsyncClient 사용)
+
+- 배치 조회의 중복 입력 합치기
+- 서버 전체 기상청 요청 동시 실행 상한(KMA_MAX_CONCURRENCY)
+- 배치 입력 개수 상한(BATCH_MAX_CITIES)
+- 캐시 적중 시 네트워크 미사용
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+
+from src import server
+
+
+class _FakeResponse:
+    def __init__(self, payload: Dict[str, Any]):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FakeClient:
+    """client.get 호출 횟수와 동시에 진행 중인 요청 수(최대값)를 기록합니다."""
+
+    def __init__(self, delay: float = 0.01, total_count: int = 1):
+        self.delay = delay
+        self.total_count = total_count
+        self.calls: List[Dict[str, str]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get(self, url: str, params: Dict[str, str]) -> _FakeResponse:
+        self.calls.append(params)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return _FakeResponse(
+            {
+                "response": {
+                    "header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+                    "body": {
+                        "items": {"item": [{"category": "T1H", "obsrValue": "21.5"}]},
+                        "totalCount": self.total_count,
+                    },
+                }
+            }
+        )
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = _FakeClient()
+    monkeypatch.setattr(
+        server, "now_kst", lambda: datetime(2025, 1, 1, 14, 30, tzinfo=server.KST)
+    )
+    monkeypatch.setattr(server, "_SERVICE_KEY", "test-key")
+    monkeypatch.setattr(server, "_HTTP_CLIENT", client)
+    monkeypatch.setattr(server, "_KMA_LIMITER", None)
+    monkeypatch.setattr(server, "_NOWCAST_CACHE", {})
+    return client
+
+
+def test_batch_dedupes_normalized_cities(fake_client):
+    out = asyncio.run(server.get_now_weather_batch(["부산", "부산광역시", "부산시"]))
+
+    assert out["ok"] is True
+    assert set(out["results"]) == {"부산", "부산광역시", "부산시"}
+    # 한 지역만 조회: 최근 정각 + -1시간 후보 = 요청 2건
+    assert len(fake_client.calls) == 2
+    first = out["results"]["부산"]
+    assert first["ok"] is True
+    assert out["results"]["부산광역시"] is first
+    assert out["results"]["부산시"] is first
+
+
+def test_in_flight_requests_capped_across_calls(fake_client):
+    cities = list(server.CITY_TO_GRID)
+
+    async def run() -> None:
+        await asyncio.gather(
+            server.get_now_weather_batch(cities),
+            server.get_now_weather_batch(cities),
+            *(server.get_now_weather(city) for city in cities),
+        )
+
+    asyncio.run(run())
+
+    assert len(fake_client.calls) > server.KMA_MAX_CONCURRENCY
+    assert fake_client.peak <= server.KMA_MAX_CONCURRENCY
+
+
+def test_batch_rejects_too_many_cities(fake_client):
+    cities = ["서울"] * (server.BATCH_MAX_CITIES + 1)
+
+    out = asyncio.run(server.get_now_weather_batch(cities))
+
+    assert out["ok"] is False
+    assert out["count"] == server.BATCH_MAX_CITIES + 1
+    assert fake_client.calls == []
+
+
+def test_cached_nowcast_skips_network(fake_client):
+    async def run() -> Dict[str, Any]:
+        await server.get_now_weather("서울")
+        fake_client.calls.clear()
+        return await server.get_now_weather("서울")
+
+    out = asyncio.run(run())
+
+    assert out["ok"] is True
+    assert fake_client.calls == []
+
+
+def test_pagination_fetches_at_most_one_extra_page(fake_client):
+    fake_client.total_count = 10_000
+
+    out = asyncio.run(server.get_now_weather("서울"))
+
+    assert out["ok"] is True
+    # 후보 2개 x (1페이지 + 2페이지 한 번)
+    assert len(fake_client.calls) == 4